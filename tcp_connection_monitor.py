@@ -1,212 +1,456 @@
 #!/usr/bin/env python3
 
+import asyncio
+import os
 import socket
+import struct
+import sys
 import time
 import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Tuple, Dict
-from collections import defaultdict
+
+try:
+    # Optional: keep counters in NumPy and compile the per-tick counter update
+    # to native code for large host sets
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+
+# Layout of the per-host counter row, in the same order as the log file columns
+CONN_BUCKETS = 0    # Conn<1s, Conn1-5s
+DNS_BUCKETS = 2     # DNS<1s, DNS1-5s
+DNS_FAILED = 4
+CONN_FAILED = 5
+TOTAL = 6
+DNS_CACHED = 7      # Appended last so existing column positions are unchanged
+ROW_SIZE = 8
+
+# Log row template; column widths are fixed, so it is built once rather than per row
+ROW_FORMAT = "%-19s | %-20s | %8d | %9d | %7d | %8d | %7d | %10d | %5d | %9d\n"
+
+# Module-level bindings for names used on every probe, avoiding repeated
+# attribute lookups on the socket and time modules
+_socket = socket.socket
+_perf_ns = time.perf_counter_ns
+_SOL_SOCKET = socket.SOL_SOCKET
+_SO_REUSEADDR = socket.SO_REUSEADDR
+_SO_REUSEPORT = getattr(socket, 'SO_REUSEPORT', None)
+_SO_LINGER = socket.SO_LINGER
+_LINGER_RST = struct.pack('ii', 1, 0)
+
+# Histogram buckets (times in milliseconds): <1s, 1-5s, and >=5s (timeout)
+TIMEOUT_BUCKET = 2
+
+
+def _bucket_idx(time_ms: float) -> int:
+    """Map a time in milliseconds to its histogram bucket index."""
+    return 0 if time_ms < 1000 else 1 if time_ms < 5000 else TIMEOUT_BUCKET
+
+
+def _bump_counts(counts, host_idx: int, connection_time_ms: float, dns_time_ms: float):
+    """
+    Record one probe result in the counter row of the given host.
+
+    Args:
+        counts: Counter matrix indexed by [host_idx][column]
+        host_idx: Index of the host's counter row
+        connection_time_ms: Connection time in milliseconds, or -1 if failed
+        dns_time_ms: DNS resolution time in milliseconds, -1 if failed, -2 if cached
+    """
+    row = counts[host_idx]
+
+    row[TOTAL] += 1
+
+    if connection_time_ms == -1:
+        row[CONN_FAILED] += 1
+    else:
+        bucket = _bucket_idx(connection_time_ms)
+        if bucket == TIMEOUT_BUCKET:
+            # Treat connections >= 5s as failures
+            row[CONN_FAILED] += 1
+        else:
+            row[CONN_BUCKETS + bucket] += 1
+
+    # Track DNS resolution time
+    if dns_time_ms == -2:
+        # Address served from the DNS cache, no lookup performed
+        row[DNS_CACHED] += 1
+    elif dns_time_ms == -1:
+        # DNS resolution failed
+        row[DNS_FAILED] += 1
+    else:
+        dns_bucket = _bucket_idx(dns_time_ms)
+        if dns_bucket == TIMEOUT_BUCKET:
+            # DNS resolution too slow (>=5s), treat as DNS failure
+            row[DNS_FAILED] += 1
+        else:
+            # DNS resolution succeeded and was within acceptable time
+            row[DNS_BUCKETS + dns_bucket] += 1
+
+
+def _bump_batch(counts, host_idxs, connection_times_ms, dns_times_ms):
+    """
+    Record all probe results of one tick.
+
+    Args:
+        counts: Counter matrix indexed by [host_idx][column]
+        host_idxs: Counter row index of each result
+        connection_times_ms: Connection time of each result, as for _bump_counts
+        dns_times_ms: DNS resolution time of each result, as for _bump_counts
+    """
+    for i in range(len(host_idxs)):
+        _bump_counts(counts, host_idxs[i], connection_times_ms[i], dns_times_ms[i])
+
+
+if njit is not None:
+    _bucket_idx = njit(cache=True)(_bucket_idx)
+    _bump_counts = njit(cache=True)(_bump_counts)
+    _bump_batch = njit(cache=True)(_bump_batch)
 
 
 class TCPConnectionMonitor:
-    def __init__(self, hosts: List[Dict[str, any]], timeout: float = 5.0):
+    def __init__(self, hosts: List[Dict[str, any]], timeout: float = 5.0, dns_cache_ttl: float = 60.0):
         """
         Initialize the TCP connection monitor.
 
         Args:
             hosts: List of dictionaries with 'hostname', 'port', and 'service' keys
             timeout: Socket connection timeout in seconds
+            dns_cache_ttl: How long resolved addresses are reused, in seconds
         """
         self.hosts = hosts
         self.timeout = timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._dns_cache_ttl_ns = int(dns_cache_ttl * 1_000_000_000)
 
-        # Create mapping from host_key to service name for display
+        # Precompute each host's key and map it to the service name for display
         self.service_names = {}
         for host in hosts:
-            host_key = f"{host['hostname']}:{host['port']}"
-            self.service_names[host_key] = host['service']
-
-        # Histogram buckets: <1s, 1-5s (times in milliseconds)
-        self.buckets = [
-            (0, 1000),      # <1s
-            (1000, 5000),   # 1-5s
-        ]
-
-        # Counters for each host and bucket
-        self.counters = defaultdict(lambda: defaultdict(int))
-        self.dns_counters = defaultdict(lambda: defaultdict(int))
-        self.total_attempts = defaultdict(int)
-        self.failed_connections = defaultdict(int)
-        self.dns_failures = defaultdict(int)
-
-        # Threading control
-        self.running = True
+            host['_key'] = f"{host['hostname']}:{host['port']}"
+            self.service_names[host['_key']] = host['service']
+        self._targets = [(host['hostname'], host['port']) for host in hosts]
+
+        # Host keys in report order; the host set is fixed, so counters are
+        # preallocated as one row per host, addressed by the host's index
+        self._host_keys = sorted(self.service_names, key=self.service_names.get)
+        self._host_index = {host_key: i for i, host_key in enumerate(self._host_keys)}
+        self._target_rows = [self._host_index[host['_key']] for host in hosts]
+        if np is not None:
+            self._target_rows = np.array(self._target_rows, dtype=np.intp)
+
+        # Counter matrices (one row per host): results are written to the active
+        # one under self.lock, and print_statistics swaps it for the zeroed spare
+        self._counts = self._new_counts()
+        self._spare_counts = self._new_counts()
+
+        # DNS cache: (hostname, port) -> (addrinfo, resolved_at_ns)
+        self._dns_cache: Dict[Tuple[str, int], Tuple[tuple, int]] = {}
+        self._dns_lock = threading.Lock()
+
+        # Daily log file, kept open and reopened when the date changes; it has
+        # its own lock so disk writes never hold up counter swaps
+        self._log_date = None
+        self._log_fp = None
+        self._log_lock = threading.Lock()
+
+        # Threading control; the lock guards counter writes and swaps.
+        # The monitoring loop runs on its own event loop and waits on _stop_event.
+        self._stop = threading.Event()
+        self._stop_event = None
+        self._loop = None
         self.lock = threading.Lock()
 
-    def measure_connection_time(self, hostname: str, port: int) -> tuple[float, float]:
+        # Worker pool for running blocking DNS lookups concurrently
+        self.pool = ThreadPoolExecutor(max_workers=max(4, len(hosts)))
+
+    def _cached_addrinfo(self, hostname: str, port: int):
+        """Return the cached address for the given host and port if it is within its TTL, else None."""
+        with self._dns_lock:
+            cached = self._dns_cache.get((hostname, port))
+        if cached and _perf_ns() - cached[1] < self._dns_cache_ttl_ns:
+            return cached[0]
+        return None
+
+    def resolve(self, hostname: str, port: int) -> Tuple[tuple, float]:
         """
-        Measure the time to establish a TCP connection to the given host and port.
-        DNS resolution is timed separately from connection timing.
+        Resolve the given host and port, reusing a cached result within its TTL.
 
         Args:
             hostname: Target hostname
             port: Target port
 
         Returns:
-            Tuple of (connection_time_ms, dns_resolution_time_ms), or (-1, -1) if failed
+            Tuple of (addrinfo, dns_resolution_time_ms); dns_resolution_time_ms is -2
+            when the address was served from the DNS cache
+        """
+        # Reuse a recently resolved address if it is still within its TTL
+        addrinfo = self._cached_addrinfo(hostname, port)
+        if addrinfo is not None:
+            return addrinfo, -2
+
+        dns_start_time = _perf_ns()
+
+        # getaddrinfo yields a ready-to-use family and sockaddr, so IPv6-only
+        # hosts work as well
+        addrinfo = socket.getaddrinfo(hostname, port, 0, socket.SOCK_STREAM, 0, socket.AI_NUMERICSERV)[0]
+        dns_end_time = _perf_ns()
+        dns_resolution_time_ms = (dns_end_time - dns_start_time) / 1_000_000
+        with self._dns_lock:
+            self._dns_cache[(hostname, port)] = (addrinfo, dns_end_time)
+        return addrinfo, dns_resolution_time_ms
+
+    @staticmethod
+    def _new_probe_socket(addrinfo: tuple) -> socket.socket:
+        """
+        Create a non-blocking socket for probing the given address.
+
+        Args:
+            addrinfo: A getaddrinfo() result for the target
+
+        Returns:
+            The unconnected socket
         """
+        family, socktype, proto, _, _ = addrinfo
+        sock = _socket(family, socktype, proto)
         try:
-            # default is timeout/failure
-            connection_time_ms, dns_resolution_time_ms = -1, -1
-            # Measure DNS resolution time
-            dns_start_time = time.time()
-            ip_address = socket.gethostbyname(hostname)
-            dns_end_time = time.time()
-            dns_resolution_time_ms = (dns_end_time - dns_start_time) * 1000
-
-            # Now measure only the TCP connection time
-            start_time = time.time()
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            sock.connect((ip_address, port))
+            # Close with RST (linger 0) so probe sockets don't pile up in TIME_WAIT
+            sock.setsockopt(_SOL_SOCKET, _SO_REUSEADDR, 1)
+            if _SO_REUSEPORT is not None:
+                sock.setsockopt(_SOL_SOCKET, _SO_REUSEPORT, 1)
+            sock.setsockopt(_SOL_SOCKET, _SO_LINGER, _LINGER_RST)
+            sock.setblocking(False)
+        except OSError:
             sock.close()
+            raise
+        return sock
+
+    def _probe_failed(self, hostname: str, port: int, error: Exception):
+        """Report a failed probe and drop its cached address."""
+        print(f"Connection failed to {hostname}:{port} - {error}")
+        # Force a fresh lookup next time in case the address has changed
+        with self._dns_lock:
+            self._dns_cache.pop((hostname, port), None)
+
+    @staticmethod
+    async def _timed_connect(loop: asyncio.AbstractEventLoop, sock: socket.socket, sockaddr: tuple) -> int:
+        """
+        Connect the given socket and return the elapsed time in nanoseconds.
 
-            end_time = time.time()
-            connection_time_ms = (end_time - start_time) * 1000
-            return connection_time_ms, dns_resolution_time_ms
-
-        except (socket.error, socket.timeout, OSError, socket.gaierror) as e:
-            print(f"Connection failed to {hostname}:{port} - {e}")
-            return connection_time_ms, dns_resolution_time_ms
+        The timestamps are taken in this coroutine, right around the
+        sock_connect await, so time spent before the task is scheduled is not
+        counted.
+        """
+        start_time = _perf_ns()
+        await loop.sock_connect(sock, sockaddr)
+        return _perf_ns() - start_time
 
-    def categorize_time(self, time_ms: float) -> str:
+    async def measure_connection_time(self, hostname: str, port: int) -> Tuple[float, float]:
         """
-        Categorize the connection time into appropriate bucket.
+        Measure the time to establish a TCP connection to the given host and port.
+        DNS resolution is timed separately from connection timing.
+
+        This is a coroutine and must be awaited on an event loop; cached
+        addresses are looked up on the loop, only cache misses go to the worker
+        pool since getaddrinfo can only block, and the connect is awaited on
+        the loop, bounded by self.timeout.
 
         Args:
-            time_ms: Connection time in milliseconds
+            hostname: Target hostname
+            port: Target port
 
         Returns:
-            String representation of the bucket
+            Tuple of (connection_time_ms, dns_resolution_time_ms), or (-1, -1) if failed.
+            dns_resolution_time_ms is -2 when the address was served from the DNS cache.
         """
-        for min_val, max_val in self.buckets:
-            if min_val <= time_ms < max_val:
-                if min_val == 0:
-                    return "<1s"
-                elif min_val == 1000:
-                    return "1-5s"
+        loop = asyncio.get_running_loop()
+        addrinfo = self._cached_addrinfo(hostname, port)
+        if addrinfo is not None:
+            dns_resolution_time_ms = -2
+        else:
+            try:
+                addrinfo, dns_resolution_time_ms = await loop.run_in_executor(self.pool, self.resolve, hostname, port)
+            except OSError as e:
+                self._probe_failed(hostname, port, e)
+                return -1, -1
 
-        # If time_ms >= 5000, it's considered a timeout/failure
-        return "timeout"
+        try:
+            sock = self._new_probe_socket(addrinfo)
+            try:
+                elapsed_ns = await asyncio.wait_for(self._timed_connect(loop, sock, addrinfo[4]), self.timeout)
+            finally:
+                sock.close()
+        except asyncio.TimeoutError:
+            self._probe_failed(hostname, port, socket.timeout("timed out"))
+            return -1, dns_resolution_time_ms
+        except OSError as e:
+            self._probe_failed(hostname, port, e)
+            return -1, dns_resolution_time_ms
+
+        return elapsed_ns / 1_000_000, dns_resolution_time_ms
+
+    async def _probe_all(self, targets: List[Tuple[str, int]]) -> List[Tuple[float, float]]:
+        """Probe all targets concurrently on the running event loop."""
+        return await asyncio.gather(*(self.measure_connection_time(hostname, port) for hostname, port in targets))
+
+    def _new_counts(self):
+        """Create a zeroed counter matrix with one row per host."""
+        if np is not None:
+            return np.zeros((len(self._host_keys), ROW_SIZE), dtype=np.uint64)
+        return [array('Q', [0] * ROW_SIZE) for _ in self._host_keys]
+
+    @staticmethod
+    def _zero_counts(counts):
+        """Reset all counter rows in place, keeping their allocation."""
+        if np is not None:
+            counts.fill(0)
+            return
+        for row in counts:
+            for i in range(ROW_SIZE):
+                row[i] = 0
+
+    def _flush_tick(self, host_idxs, connection_times_ms: List[float], dns_times_ms: List[float]):
+        """
+        Apply all probe results from one monitoring tick to the counters under
+        a single lock acquire.
 
-    def update_counters(self, hostname: str, port: int, connection_time_ms: float, dns_time_ms: float):
+        Args:
+            host_idxs: Counter row index of each result
+            connection_times_ms: Connection time of each result in milliseconds
+            dns_times_ms: DNS resolution time of each result in milliseconds
         """
-        Update the histogram counters for the given connection and DNS resolution times.
+        if np is not None:
+            connection_times_ms = np.array(connection_times_ms, dtype=np.float64)
+            dns_times_ms = np.array(dns_times_ms, dtype=np.float64)
+        with self.lock:
+            _bump_batch(self._counts, host_idxs, connection_times_ms, dns_times_ms)
+
+    def _ensure_log_open(self, now: datetime):
+        """
+        Make sure the log file for the given date is open, rotating daily.
 
         Args:
-            hostname: Target hostname
-            port: Target port
-            connection_time_ms: Connection time in milliseconds
-            dns_time_ms: DNS resolution time in milliseconds
+            now: Current time, used to pick the daily log file
         """
-        host_key = f"{hostname}:{port}"
+        log_date = now.strftime('%Y%m%d')
+        if log_date == self._log_date:
+            return
+
+        if self._log_fp is not None:
+            self._log_fp.close()
+
+        self._log_fp = open(f"tcp_stats_{log_date}.log", 'a', buffering=1 << 16)
+        self._log_date = log_date
 
+        # Write header if file is new/empty
+        if os.fstat(self._log_fp.fileno()).st_size == 0:
+            self._log_fp.write(f"{'Timestamp':<19} | {'Service':<20} | {'Conn<1s':>8} | {'Conn1-5s':>9} | {'DNS<1s':>7} | {'DNS1-5s':>8} | {'DNSFail':>7} | {'ConnFailed':>10} | {'Total':>5} | {'DNSCached':>9}\n")
+            self._log_fp.write("-" * 119 + "\n")
+
+    def _reset_counters(self) -> List[Tuple[str, tuple]]:
+        """
+        Collect the counters accumulated since the last call and reset them.
+
+        Returns:
+            List of (host_key, counter_row) for hosts with at least one attempt
+        """
         with self.lock:
-            self.total_attempts[host_key] += 1
-
-            if connection_time_ms == -1:
-                self.failed_connections[host_key] += 1
-            elif connection_time_ms >= 5000:
-                # Treat connections >= 5s as failures
-                self.failed_connections[host_key] += 1
-            else:
-                bucket = self.categorize_time(connection_time_ms)
-                if bucket != "timeout":
-                    self.counters[host_key][bucket] += 1
-
-            # Track DNS resolution time
-            if dns_time_ms == -1:
-                # DNS resolution failed
-                self.dns_failures[host_key] += 1
-            elif dns_time_ms >= 5000:
-                # DNS resolution too slow (>=5s), treat as DNS failure
-                self.dns_failures[host_key] += 1
-            else:
-                # DNS resolution succeeded and was within acceptable time
-                dns_bucket = self.categorize_time(dns_time_ms)
-                if dns_bucket != "timeout":
-                    self.dns_counters[host_key][dns_bucket] += 1
+            # Swap the active counters for the zeroed spare, then snapshot and
+            # zero the retired ones so they become the next spare
+            counts, self._counts = self._counts, self._spare_counts
+            rows = counts.tolist() if np is not None else counts
+            snapshot = [(host_key, tuple(row)) for host_key, row in zip(self._host_keys, rows) if row[TOTAL]]
+            self._zero_counts(counts)
+            self._spare_counts = counts
+
+        return snapshot
 
     def print_statistics(self):
         """Print current statistics to log file and reset counters."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_filename = f"tcp_stats_{datetime.now().strftime('%Y%m%d')}.log"
+        now = datetime.now()
+        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Only the snapshot is taken under the lock; formatting and I/O run outside it
+        snapshot = self._reset_counters()
+
+        if snapshot:
+            rows = []
+            for host_key, row in snapshot:
+                # Get service name for display
+                service_name = self.service_names.get(host_key, host_key.split(':')[0].split('.')[0])
+
+                # Counter rows are laid out in log column order
+                rows.append(ROW_FORMAT % ((current_time, service_name) + row))
+
+            # Write all rows to the log file in a single write
+            with self._log_lock:
+                self._ensure_log_open(now)
+                self._log_fp.write(''.join(rows))
+                self._log_fp.flush()
+                log_filename = self._log_fp.name
+
+            # Also print to console for immediate feedback
+            print(f"Statistics logged to {log_filename} at {current_time}")
+
+    def close_log(self):
+        """Flush and close the log file."""
+        with self._log_lock:
+            if self._log_fp is not None:
+                self._log_fp.close()
+                self._log_fp = None
+                self._log_date = None
+
+    async def _monitor(self):
+        """Probe all hosts every 2 seconds until stopped."""
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
+        while not self._stop.is_set():
+            # Probe all hosts concurrently so one slow host doesn't stall the others
+            try:
+                results = await self._probe_all(self._targets)
+            except RuntimeError:
+                # The pool is shut down while stopping; anything else is a bug
+                if self._stop.is_set():
+                    break
+                raise
 
-        with self.lock:
-            if self.total_attempts:
-                # Write to log file
-                with open(log_filename, 'a') as log_file:
-                    # Write header if file is new/empty
-                    try:
-                        if log_file.tell() == 0:
-                            log_file.write(f"{'Timestamp':<19} | {'Service':<20} | {'Conn<1s':>8} | {'Conn1-5s':>9} | {'DNS<1s':>7} | {'DNS1-5s':>8} | {'DNSFail':>7} | {'ConnFailed':>10} | {'Total':>5}\n")
-                            log_file.write("-" * 107 + "\n")
-                    except OSError:
-                        # File position not available, skip header check
-                        pass
-
-                    for host_key in sorted(self.total_attempts.keys(), key=lambda k: self.service_names.get(k, k)):
-                        # Get connection bucket counts
-                        conn_under_1s = self.counters[host_key].get("<1s", 0)
-                        conn_1_to_5s = self.counters[host_key].get("1-5s", 0)
-
-                        # Get DNS bucket counts
-                        dns_under_1s = self.dns_counters[host_key].get("<1s", 0)
-                        dns_1_to_5s = self.dns_counters[host_key].get("1-5s", 0)
-                        dns_failed = self.dns_failures[host_key]
-
-                        failed = self.failed_connections[host_key]
-                        total = self.total_attempts[host_key]
-
-                        # Get service name for display
-                        service_name = self.service_names.get(host_key, host_key.split(':')[0].split('.')[0])
-
-                        # Write data row to log file
-                        log_file.write(f"{current_time:<19} | {service_name:<20} | {conn_under_1s:>8} | {conn_1_to_5s:>9} | {dns_under_1s:>7} | {dns_1_to_5s:>8} | {dns_failed:>7} | {failed:>10} | {total:>5}\n")
-
-                # Also print to console for immediate feedback
-                print(f"Statistics logged to {log_filename} at {current_time}")
-
-            # Reset counters
-            self.counters.clear()
-            self.dns_counters.clear()
-            self.dns_failures.clear()
-            self.total_attempts.clear()
-            self.failed_connections.clear()
+            self._flush_tick(self._target_rows, [conn for conn, _ in results], [dns for _, dns in results])
 
-    def monitoring_loop(self):
-        """Main monitoring loop that tests connections every 2 seconds."""
-        while self.running:
-            for host in self.hosts:
-                if not self.running:
-                    break
+            # One progress dot per probe, written once per tick
+            sys.stdout.write("." * len(self.hosts))
+            sys.stdout.flush()
 
-                hostname = host['hostname']
-                port = host['port']
-                connection_time, dns_time = self.measure_connection_time(hostname, port)
-                print(".", end="", flush=True)
-                self.update_counters(hostname, port, connection_time, dns_time)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), 2)
+                return
+            except asyncio.TimeoutError:
+                pass
 
-            if self.running:
-                time.sleep(2)
+    def monitoring_loop(self):
+        """Main monitoring loop that tests connections every 2 seconds."""
+        asyncio.run(self._monitor())
+
+    def stop(self):
+        """Signal the monitoring and statistics loops to stop."""
+        self._stop.set()
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Event loop already closed
+                pass
 
     def statistics_loop(self):
         """Loop that prints statistics every 5 minutes."""
-        while self.running:
-            time.sleep(300)  # 5 minutes
-            if self.running:
-                self.print_statistics()
+        while not self._stop.wait(300):  # 5 minutes
+            self.print_statistics()
 
     def start(self):
         """Start the monitoring and statistics threads."""
@@ -224,16 +468,23 @@ class TCPConnectionMonitor:
         stats_thread.start()
 
         try:
-            # Keep main thread alive
-            while True:
-                time.sleep(1)
+            # Keep main thread alive until stopped
+            self._stop.wait()
         except KeyboardInterrupt:
             print("\nStopping monitor...")
-            self.running = False
+            self.stop()
+
+            # Let the tick in progress record its results before the final flush
+            monitor_thread.join(self.timeout + 1)
+
+            # Drop queued lookups; a getaddrinfo call that is already running
+            # cannot be interrupted and delays interpreter exit until it returns
+            self.pool.shutdown(wait=False, cancel_futures=True)
 
             # Print final statistics
             print("\nFinal Statistics:")
             self.print_statistics()
+            self.close_log()
 
 
 def main():
@@ -258,7 +509,7 @@ def main():
         }
     ]
 
-    monitor = TCPConnectionMonitor(hosts, timeout=5.0)
+    monitor = TCPConnectionMonitor(hosts, timeout=5.0, dns_cache_ttl=60.0)
     monitor.start()
 
 